@@ -6,34 +6,39 @@ from secret_hitler_simulator.game import Game
 from secret_hitler_simulator.players.aggroFascist import AggroFascist
 from secret_hitler_simulator.players.naiveLiberal import NaiveLiberal
 
-# Create a game of 5 Liberals and 4 Aggro Fascists
-liberals = [
-    NaiveLiberal(),
-    NaiveLiberal(),
-    NaiveLiberal(),
-    NaiveLiberal(),
-    NaiveLiberal(),
-]
-hitler = AggroFascist()
-fascists = [hitler, AggroFascist(), AggroFascist(), AggroFascist()]
-presidential_order_list = liberals + fascists
-random.shuffle(presidential_order_list)
-presidential_order = tuple(presidential_order_list)
-game = Game(
-    liberals=frozenset(liberals),
-    fascists=frozenset(fascists),
-    hitler=hitler,
-    policy_deck=Game.generate_random_policy_deck(),
-    presidential_order=presidential_order,
-)
 
-# Play game
-result, reason = game.play_game()
-print(f"Winner: {result}")
-print(f"Reason: {reason}")
-print("")
+def main():
+    # Create a game of 5 Liberals and 4 Aggro Fascists
+    liberals = [
+        NaiveLiberal(),
+        NaiveLiberal(),
+        NaiveLiberal(),
+        NaiveLiberal(),
+        NaiveLiberal(),
+    ]
+    hitler = AggroFascist()
+    fascists = [hitler, AggroFascist(), AggroFascist(), AggroFascist()]
+    all_players = liberals + fascists
+    presidential_order = random.sample(all_players, len(all_players))
+    game = Game(
+        liberals=frozenset(liberals),
+        fascists=frozenset(fascists),
+        hitler=hitler,
+        policy_deck=Game.generate_random_policy_deck(),
+        presidential_order=presidential_order,
+    )
 
-game_report = game.write_game_report()
-if "Exception" not in reason:
-    for line in game_report:
-        print(line)
+    # Play game
+    result, reason = game.play_game()
+    print(f"Winner: {result}")
+    print(f"Reason: {reason}")
+    print("")
+
+    game_report = game.write_game_report()
+    if "Exception" not in reason:
+        for line in game_report:
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,32 +5,37 @@ import random
 from secret_hitler_simulator.game import Game
 from secret_hitler_simulator.players.naiveLiberal import NaiveLiberal
 
-# Create a game of 9 Liberals, even as Fascists and hitler
-liberals = [
-    NaiveLiberal(),
-    NaiveLiberal(),
-    NaiveLiberal(),
-    NaiveLiberal(),
-    NaiveLiberal(),
-]
-hitler = NaiveLiberal()
-fascists = [hitler, NaiveLiberal(), NaiveLiberal(), NaiveLiberal()]
-presidential_order_list = liberals + fascists
-random.shuffle(presidential_order_list)
-presidential_order = tuple(presidential_order_list)
-game = Game(
-    liberals=frozenset(liberals),
-    fascists=frozenset(fascists),
-    hitler=hitler,
-    policy_deck=Game.generate_random_policy_deck(),
-    presidential_order=presidential_order,
-)
 
-# Play game
-result, reason = game.play_game()
-print(result)
-print(reason)
+def main():
+    # Create a game of 9 Liberals, even as Fascists and hitler
+    liberals = [
+        NaiveLiberal(),
+        NaiveLiberal(),
+        NaiveLiberal(),
+        NaiveLiberal(),
+        NaiveLiberal(),
+    ]
+    hitler = NaiveLiberal()
+    fascists = [hitler, NaiveLiberal(), NaiveLiberal(), NaiveLiberal()]
+    all_players = liberals + fascists
+    presidential_order = random.sample(all_players, len(all_players))
+    game = Game(
+        liberals=frozenset(liberals),
+        fascists=frozenset(fascists),
+        hitler=hitler,
+        policy_deck=Game.generate_random_policy_deck(),
+        presidential_order=presidential_order,
+    )
 
-game_report = game.write_game_report()
-for line in game_report:
-    print(line)
+    # Play game
+    result, reason = game.play_game()
+    print(result)
+    print(reason)
+
+    game_report = game.write_game_report()
+    for line in game_report:
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
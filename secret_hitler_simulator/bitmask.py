@@ -0,0 +1,20 @@
+# Standard Library Imports
+import random
+
+
+def choose_set_bit(mask: int) -> int:
+    """Randomly choose one of the set bits of a bitmask
+
+    Draws from the global random number generator exactly as random.choice would from the ascending tuple of set bits,
+    without building the tuple.
+
+    Args:
+        mask (int): Bitmask to choose from, must have at least one bit set
+
+    Returns:
+        int: The index of the chosen bit
+    """
+    # Clear the lowest set bit until the chosen bit is the lowest
+    for _ in range(random.randrange(mask.bit_count())):
+        mask &= mask - 1
+    return (mask & -mask).bit_length() - 1
@@ -1,15 +1,23 @@
 # Standard Library Imports
-from enum import Enum
+from enum import Enum, IntEnum
 
 
-class Allegiance(Enum):
-    LIBERAL = "LIBERAL"
-    FASCIST = "FASCIST"
+class Allegiance(IntEnum):
+    LIBERAL = 0
+    FASCIST = 1
 
+    # Keep printing members by name rather than by integer value
+    __str__ = Enum.__str__
+    __format__ = Enum.__format__
 
-class Policy(Enum):
-    LIBERAL = "LIBERAL"
-    FASCIST = "FASCIST"
+
+class Policy(IntEnum):
+    LIBERAL = 0
+    FASCIST = 1
+
+    # Keep printing members by name rather than by integer value
+    __str__ = Enum.__str__
+    __format__ = Enum.__format__
 
 
 PARTY_MEMBERSHIP_BY_PLAYERS = {
@@ -20,3 +28,5 @@ PARTY_MEMBERSHIP_BY_PLAYERS = {
     9: {Allegiance.LIBERAL: 5, Allegiance.FASCIST: 4},
     10: {Allegiance.LIBERAL: 6, Allegiance.FASCIST: 4},
 }
+
+POLICY_DECK = 11 * (Policy.FASCIST,) + 6 * (Policy.LIBERAL,)
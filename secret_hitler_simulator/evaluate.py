@@ -1,4 +1,6 @@
 # Standard Library Imports
+import multiprocessing
+import os
 import random
 from typing import Optional
 
@@ -6,6 +8,11 @@ from typing import Optional
 from secret_hitler_simulator.constants import Allegiance
 from secret_hitler_simulator.game import Game
 from secret_hitler_simulator.player import Player
+from secret_hitler_simulator.simulate import new_game_rng
+
+# Results of games played by stateless players, keyed by the players' roles and the random number seed of the game
+_GAME_RESULT_CACHE: dict[tuple, tuple[Allegiance, str]] = {}
+_GAME_RESULT_CACHE_SIZE = 2**20
 
 
 def evaluate_liberal_player(
@@ -15,15 +22,30 @@ def evaluate_liberal_player(
     hitler: Player,
     num_games: int,
     seed: Optional[int] = None,
+    num_workers: Optional[int] = 1,
+    verbose: bool = False,
+    stateless: bool = False,
 ):
     """Evaluate the win rate of a liberal player
 
+    Games are independent of each other, so they can be played in batches in parallel across a pool of worker
+    processes. Each game is seeded with its own sub-seed derived from `seed`, so results are reproducible regardless of
+    scheduling.
+
+    If every player is stateless, i.e. its decisions depend only on the game state and the random number generator,
+    a seeded game is fully determined by the class of each player, their roles, and the seed of the game. In that case
+    the results of previously played games are reused instead of playing them again.
+
     Args:
         liberal_player (Player): The liberal player being evaluated
         other_liberals (tuple[Player]): The other Liberals being played with
         fascists (tuple[Player]): The other Fascists being played with
         hitler (Player): Hitler, must be in fascist_players
         seed (Optional[int]): The random number seed if not None
+        num_workers (Optional[int]): The number of worker processes, the number of CPUs if None. Games are played in
+            this process if 1.
+        verbose (bool): Whether to print the result of every game
+        stateless (bool): Whether every player is stateless, allowing the results of previous games to be reused
 
     Returns:
         int: Number of games won
@@ -32,33 +54,139 @@ def evaluate_liberal_player(
     # Intialize value
     num_wins = 0
 
-    # Set random seed
-    random.seed(seed)
+    # Derive a random seed for every game
+    game_seeds = tuple(
+        None if seed is None else seed * num_games + game_num
+        for game_num in range(num_games)
+    )
+
+    # Reuse the results of games already played with the same roles and seeds
+    use_cache = stateless and seed is not None
+    game_results: list[Optional[tuple[Allegiance, str]]] = num_games * [None]
+    if use_cache:
+        roles = (
+            tuple(type(player) for player in other_liberals + (liberal_player,)),
+            tuple(type(player) for player in fascists),
+            fascists.index(hitler),
+        )
+        game_results = [
+            _GAME_RESULT_CACHE.get((roles, game_seed)) for game_seed in game_seeds
+        ]
+    unplayed_games = [
+        game_num
+        for game_num, game_result in enumerate(game_results)
+        if game_result is None
+    ]
+
+    # Split games into batches so players are only sent to a worker once per batch
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    batch_size = max(1, -(-len(unplayed_games) // (8 * num_workers)))
+    batches = [
+        unplayed_games[batch_start : batch_start + batch_size]
+        for batch_start in range(0, len(unplayed_games), batch_size)
+    ]
+    batch_args = [
+        (
+            liberal_player,
+            other_liberals,
+            fascists,
+            hitler,
+            tuple(game_seeds[game_num] for game_num in batch),
+        )
+        for batch in batches
+    ]
+
+    # Play batches in this process, leaving the global random number generator as the caller had it
+    if num_workers == 1:
+        global_rng_state = random.getstate()
+        try:
+            all_batch_results = tuple(map(_play_batch, batch_args))
+        finally:
+            random.setstate(global_rng_state)
+    # Play batches across worker processes
+    elif len(batches) > 0:
+        with multiprocessing.Pool(processes=num_workers) as pool:
+            all_batch_results = tuple(pool.imap(_play_batch, batch_args))
+    else:
+        all_batch_results = ()
+    for batch, batch_results in zip(batches, all_batch_results):
+        for game_num, game_result in zip(batch, batch_results):
+            game_results[game_num] = game_result
+
+    # Save results for reuse
+    if use_cache:
+        for game_num in unplayed_games:
+            if len(_GAME_RESULT_CACHE) >= _GAME_RESULT_CACHE_SIZE:
+                break
+            _GAME_RESULT_CACHE[(roles, game_seeds[game_num])] = game_results[game_num]
+
+    # Tally results
+    for game_num, (result, reason) in enumerate(game_results):
+        if verbose:
+            print(f"Game #{game_num + 1}")
+            print(f"Winner: {result}")
+            print(f"Reason: {reason}")
+            print("")
+
+        if result is Allegiance.LIBERAL:
+            num_wins += 1
+
+    return num_wins
+
 
-    # Iterate through games
-    for game_num in range(num_games):
+def batch_play_games(
+    liberal_player: Player,
+    other_liberals: tuple[Player],
+    fascists: tuple[Player],
+    hitler: Player,
+    game_seeds: tuple[Optional[int]],
+) -> tuple[tuple[Allegiance, str]]:
+    """Play a batch of games with the same players, one per random number seed
 
-        liberals = other_liberals + (liberal_player,)
+    Args:
+        liberal_player (Player): The liberal player being evaluated
+        other_liberals (tuple[Player]): The other Liberals being played with
+        fascists (tuple[Player]): The other Fascists being played with
+        hitler (Player): Hitler, must be in fascist_players
+        game_seeds (tuple[Optional[int]]): The random number seed of each game
+
+    Returns:
+        tuple[tuple[Allegiance, str]]: The winning team and reason for victory of each game
+    """
+    # Roles are the same in every game, so only build them once
+    liberals = other_liberals + (liberal_player,)
+    liberals_set = frozenset(liberals)
+    fascists_set = frozenset(fascists)
+    all_players = liberals + fascists
+    number_of_players = len(all_players)
 
-        presidential_order_list = list(liberals) + list(fascists)
-        random.shuffle(presidential_order_list)
-        presidential_order = tuple(presidential_order_list)
-        game = Game(
-            liberals=frozenset(liberals),
-            fascists=frozenset(fascists),
+    # Bind functions called every game to local names to skip repeated global and attribute lookups
+    new_rng = new_game_rng
+    generate_random_policy_deck = Game.generate_random_policy_deck
+    new_game = Game
+
+    batch_results: list[tuple[Allegiance, str]] = []
+    save_result = batch_results.append
+    for game_seed in game_seeds:
+        # Set up the game from its own random number generator
+        rng = new_rng(game_seed)
+        presidential_order = rng.sample(all_players, number_of_players)
+        game = new_game(
+            liberals=liberals_set,
+            fascists=fascists_set,
             hitler=hitler,
-            policy_deck=Game.generate_random_policy_deck(),
+            policy_deck=generate_random_policy_deck(rng),
             presidential_order=presidential_order,
         )
 
         # Play game
-        result, reason = game.play_game()
-        print(f"Game #{game_num + 1}")
-        print(f"Winner: {result}")
-        print(f"Reason: {reason}")
-        print("")
+        save_result(game.play_game())
+    return tuple(batch_results)
 
-        if result == Allegiance.LIBERAL:
-            num_wins += 1
 
-    return num_wins
+def _play_batch(
+    args: tuple[Player, tuple[Player], tuple[Player], Player, tuple[Optional[int]]],
+) -> tuple[tuple[Allegiance, str]]:
+    """Unpack the arguments of a batch of games sent to a worker process"""
+    return batch_play_games(*args)
@@ -1,19 +1,32 @@
 # Standard Library imports
 import random
-from copy import deepcopy
-from dataclasses import dataclass, fields
+from collections import deque
+from copy import copy
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from traceback import format_exception
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional, Sequence
 
 # Module Imports
 from secret_hitler_simulator.constants import (
     PARTY_MEMBERSHIP_BY_PLAYERS,
+    POLICY_DECK,
     Allegiance,
     Policy,
 )
 from secret_hitler_simulator.errors import PlayerException
 from secret_hitler_simulator.player import Player
 
+# Policy discarded by the President when every policy drawn is the same, keyed by the number of Fascist policies drawn
+_FORCED_PRESIDENT_DISCARD = {0: Policy.LIBERAL, 3: Policy.FASCIST}
+# Policies discarded and selected by the Chancellor when both policies handed over are the same, keyed by the number of
+# Fascist policies handed over
+_FORCED_CHANCELLOR_DISCARD = {
+    0: (Policy.LIBERAL, Policy.LIBERAL),
+    2: (Policy.FASCIST, Policy.FASCIST),
+}
+
 
 class Game:
     """Game of Secret Hitler"""
@@ -24,7 +37,8 @@ class Game:
         fascists: frozenset[Player],
         hitler: Player,
         policy_deck: tuple["Policy"],
-        presidential_order: tuple["Player"],
+        presidential_order: Sequence["Player"],
+        seed: Optional[int] = None,
     ):
         """Initialize a Game of Secret Hitler
 
@@ -33,23 +47,27 @@ class Game:
             fascists (frozenset[Player]): The players who are fascists (including Hitler)
             hitler (Player): The player who is Hitler
             policy_deck (tuple[Policy]): The deck of policies to draw from
-            presidential_order (tuple[Player]): The order players will be President
+            presidential_order (Sequence[Player]): The order players will be President
+            seed (Optional[int]): The random number seed for reshuffling the policy deck, or None to continue from the
+                state of the global random number generator
         """
-        # Ensure valid attributes
+        # Ensure valid attributes, counting each role in a single pass over the presidential order
         number_players = len(presidential_order)
+        liberals_in_order = 0
+        fascists_in_order = 0
         for player in presidential_order:
-            if (
-                player not in liberals
-                and player not in fascists
-                and player is not hitler
-            ):
+            if player in liberals:
+                liberals_in_order += 1
+            elif player in fascists:
+                fascists_in_order += 1
+            else:
                 raise ValueError(f"Player {player} does not have an assigned role.")
-        if not liberals.issubset(presidential_order):
+        if liberals_in_order != len(liberals):
             raise ValueError("Not every liberal player is in presidential order.")
-        if not fascists.issubset(presidential_order):
+        if fascists_in_order != len(fascists):
             raise ValueError("Not every fascist player is in presidential order.")
-        if hitler not in presidential_order:
-            raise ValueError(f"Hitler ({hitler}) is not in presidential order")
+        if hitler not in fascists:
+            raise ValueError(f"Hitler ({hitler}) is not a fascist.")
         if (
             len(liberals)
             != PARTY_MEMBERSHIP_BY_PLAYERS[number_players][Allegiance.LIBERAL]
@@ -69,13 +87,27 @@ class Game:
         self.liberals = liberals
         self.fascists = fascists
         self.hitler = hitler
-        self.policy_deck = policy_deck
-        self.presidential_order = presidential_order
+        # The policy deck is stored as a contiguous buffer of Policy values
+        self.policy_deck = bytearray(policy_deck)
+        self.presidential_order: deque[Player] = deque(presidential_order)
 
         # Initialize settings
-        self.round_history: tuple[RoundRecord] = tuple()
-        self.players = presidential_order
-        self.executed_players = tuple()
+        self.round_history: list[RoundRecord] = []
+        self._closed_game_states: dict[int, list[Optional[RoundRecord]]] = {}
+        self.players = tuple(presidential_order)
+        self._player_id = {player: id for id, player in enumerate(self.players)}
+        # A repeated player could stand in for a missing player of the same party in the role counts above
+        if len(self._player_id) != number_players:
+            raise ValueError("A player appears more than once in presidential order.")
+        fascist_ids = sorted(self._player_id[player] for player in fascists)
+        self._game_record = GameRecord(
+            number_of_players=len(self.players),
+            # Sorted so the frozenset iterates in the same order every run
+            fascists=frozenset(fascist_ids),
+            hitler=self._player_id[hitler],
+            fascist_mask=sum(1 << fascist_id for fascist_id in fascist_ids),
+        )
+        self.executed_players: set[Player] = set()
         self.special_election_next_president: Optional[Player] = None
         self.previous_government: frozenset[Player] = frozenset()
         self.anarchy_counter = 0
@@ -84,18 +116,25 @@ class Game:
         self.shot_hitler = False
         self.elected_hitler = False
 
-        # Save random number generator so players can't cheat
-        self.random_number_generator = random.getstate()
+        # Own random number generator so players can't cheat
+        self._rng = random.Random(seed)
+        if seed is None:
+            self._rng.setstate(random.getstate())
 
     @classmethod
-    def generate_random_policy_deck(self) -> tuple[Policy]:
+    def generate_random_policy_deck(
+        self, rng: Optional[random.Random] = None
+    ) -> tuple[Policy]:
         """Generate a randomly shuffled policy deck
 
+        Args:
+            rng (Optional[random.Random]): The random number generator to shuffle with, the global one if None
+
         Returns:
             tuple[Policy]: Randomly shuffled policy deck
         """
-        policy_deck_list = 11 * [Policy.FASCIST] + 6 * [Policy.LIBERAL]
-        random.shuffle(policy_deck_list)
+        policy_deck_list = list(POLICY_DECK)
+        (random if rng is None else rng).shuffle(policy_deck_list)
         return tuple(policy_deck_list)
 
     def play_game(self) -> tuple[Allegiance, str]:
@@ -106,9 +145,10 @@ class Game:
             str: The reason for victory
         """
         try:
-            while self.determine_if_winner()[0] is None:
-                self.play_round()
-            return self.determine_if_winner()
+            while True:
+                result = self.play_round()
+                if result is not None:
+                    return result
         except PlayerException as e:
             player_generating_exception = e.args[0]["player"]
             if player_generating_exception in self.liberals:
@@ -121,11 +161,11 @@ class Game:
                     "during game."
                 )
 
-    def play_round(self) -> Optional[Allegiance]:
+    def play_round(self) -> Optional[tuple[Allegiance, str]]:
         """Play a round of Secret Hitler
 
         Returns:
-            Optional[Allegiance]: The winning team, or None if game continues
+            Optional[tuple[Allegiance, str]]: The winning team and the reason for victory, or None if game continues
         """
         # Update policy deck
         # * In theory this is done at the end of rounds, but doing it here means we don't need to shuffle after the game
@@ -149,10 +189,11 @@ class Game:
 
         # Election results
         if successful_election:
+            self.previous_government = frozenset((president, chancellor))
             # Check for Hitler
             if self.fascist_policies_passed >= 3 and chancellor is self.hitler:
                 self.elected_hitler = True
-                return
+                return self.determine_if_winner()
             # Pass a policy
             passed_policy = self.hold_legislation_session(president, chancellor)
             # Executive action
@@ -164,19 +205,80 @@ class Game:
             if self.anarchy_counter == 3:
                 self.execute_anarchy()
 
+        # Check for a winner
+        winner, reason = self.determine_if_winner()
+        if winner is not None:
+            return winner, reason
+        return None
+
     def update_round_history(self):
-        self.round_history = self.round_history + (
-            RoundRecord(
-                _previous_record=(
-                    None if len(self.round_history) == 0 else self.round_history[-1]
-                ),
-                number_of_players=len(self.players),
-                fascists=frozenset(
-                    self.players.index(player) for player in self.fascists
-                ),
-                hitler=self.players.index(self.hitler),
-            ),
+        if len(self.round_history) == 0:
+            round_record = RoundRecord(
+                game_record=self._game_record,
+                living_players=tuple(range(len(self.players))),
+                living_mask=(1 << len(self.players)) - 1,
+            )
+            self.update_ineligible_for_chancellorship(round_record)
+            self.round_history.append(round_record)
+            return
+        # Carry the running totals over from the previous round
+        previous_record = self.round_history[-1]
+        round_record = RoundRecord(
+            game_record=self._game_record,
+            _previous_record=previous_record,
+            number_of_liberal_policies_passed=previous_record.number_of_liberal_policies_passed,
+            number_of_fascist_policies_passed=previous_record.number_of_fascist_policies_passed,
+            anarchy_counter=previous_record.anarchy_counter,
+            executed_players=previous_record.executed_players,
+            executed_mask=previous_record.executed_mask,
+            living_players=previous_record.living_players,
+            living_mask=previous_record.living_mask,
         )
+        self.update_ineligible_for_chancellorship(round_record)
+        self.round_history.append(round_record)
+
+    @staticmethod
+    def update_ineligible_for_chancellorship(round_record: "RoundRecord"):
+        """Update the players ineligable for the chancellorship in a round
+
+        Args:
+            round_record (RoundRecord): The record of the round
+        """
+        previous_record = round_record._previous_record
+        if previous_record is None:
+            ineligible_for_chancellorship = tuple()
+            ineligible_mask = 0
+        elif round_record.number_of_players - len(round_record.executed_players) <= 5:
+            ineligible_for_chancellorship = previous_record.executed_players
+            ineligible_mask = previous_record.executed_mask
+        elif previous_record.successful_election:
+            ineligible_for_chancellorship = previous_record.executed_players + (
+                previous_record.chancellor,
+            )
+            ineligible_mask = previous_record.executed_mask | (
+                1 << previous_record.chancellor
+            )
+        else:
+            ineligible_for_chancellorship = (
+                previous_record.ineligible_for_chancellorship
+            )
+            ineligible_mask = previous_record.ineligible_mask
+        round_record.ineligible_for_chancellorship = ineligible_for_chancellorship
+        round_record.ineligible_mask = ineligible_mask
+        # Reuse the previous round's candidates when nobody new is ineligible
+        if (
+            previous_record is not None
+            and ineligible_mask == previous_record.ineligible_mask
+        ):
+            round_record.eligible_for_chancellorship = (
+                previous_record.eligible_for_chancellorship
+            )
+        else:
+            round_record.eligible_for_chancellorship = tuple(
+                player_id
+                for player_id in range(round_record.number_of_players)
+                if not ineligible_mask >> player_id & 1
+            )
 
     def determine_next_president(self) -> tuple[Player, int]:
         """Determine the next president
@@ -191,8 +293,8 @@ class Game:
             self.special_election_next_president = None
         else:
             president = self.presidential_order[0]
-            self.presidential_order = self.presidential_order[1:] + (president,)
-        president_id = self.players.index(president)
+            self.presidential_order.rotate(-1)
+        president_id = self._player_id[president]
         self.round_history[-1].president = president_id
         return president, president_id
 
@@ -207,58 +309,75 @@ class Game:
         Returns:
             dict[int, dict[int, Optional[bool]]]: The expressed voting intention of every player for every chancellor
         """
-        declared_election_intent: dict[int, dict[int, Optional[bool]]] = {}
-        for proposed_chancellor in self.players:
-            proposed_chancellor_id = self.players.index(proposed_chancellor)
-            if (
+        proposed_chancellor_ids = tuple(
+            self._player_id[proposed_chancellor]
+            for proposed_chancellor in self.players
+            if not (
                 proposed_chancellor in self.executed_players
                 or proposed_chancellor is president
                 or (
                     proposed_chancellor in self.previous_government
                     and len(self.presidential_order) > 5
                 )
-            ):
-                continue
-            for player in self.players:
-                if player in self.executed_players:
-                    continue
-                player_id = self.players.index(player)
-                game_state = self.get_player_percieved_game_state(player)
-                declared_election_intent.setdefault(proposed_chancellor_id, {})[
-                    player_id
-                ] = player.intent_to_vote_on_government(
-                    game_state,
+            )
+        )
+        eligible_voters = self.get_eligible_voters()
+        declared_election_intent: dict[int, dict[int, Optional[bool]]] = {
+            proposed_chancellor_id: {}
+            for proposed_chancellor_id in proposed_chancellor_ids
+        }
+        for player_id, player in eligible_voters:
+            game_state = self.get_player_percieved_game_state(player)
+            player_election_intent = player.intent_to_vote_on_governments(
+                game_state, proposed_chancellor_ids
+            )
+            for proposed_chancellor_id in proposed_chancellor_ids:
+                declared_election_intent[proposed_chancellor_id][player_id] = (
+                    player_election_intent[proposed_chancellor_id]
                 )
         self.round_history[-1].declared_election_intent = declared_election_intent
 
+    def get_eligible_voters(self) -> tuple[tuple[int, Player]]:
+        """Return every player still alive to vote
+
+        Returns:
+            tuple[tuple[int, Player]]: The player id and player of every living player
+        """
+        return tuple(
+            (player_id, player)
+            for player_id, player in enumerate(self.players)
+            if player not in self.executed_players
+        )
+
     def select_chancellor(self, president: Player) -> tuple[Player, int]:
-        president_perspective = self.get_player_percieved_game_state(president)
-        try:
-            chancellor_id = president.select_chancellor(president_perspective)
-        except Exception as e:
-            raise PlayerException(
-                {
-                    "message": f"Exception from {president} while selecting Chancellor",
-                    "player": president,
-                }
-            ) from e
+        chancellor_id = self._call_player(
+            president,
+            "select_chancellor",
+            self.get_player_percieved_game_state(president),
+            context="selecting Chancellor",
+        )
         self.round_history[-1].chancellor = chancellor_id
         chancellor = self.players[chancellor_id]
         return chancellor, chancellor_id
 
     def hold_election(self) -> bool:
-        election_results: dict[Player, bool] = {}
-        for player in self.players:
-            if player in self.executed_players:
-                continue
-            player_id = self.players.index(player)
+        election_results: dict[int, bool] = {}
+        yea_votes = 0
+        for player_id, player in self.get_eligible_voters():
             player_perception = self.get_player_percieved_game_state(player)
-            election_results[player_id] = player.vote_on_government(
+            vote = player.vote_on_government(
                 player_perception,
             )
-        successful_election = sum(election_results.values()) > len(self.players) / 2
+            election_results[player_id] = vote
+            yea_votes += vote
+        # Votes are needed from a majority of every player in the game, including executed players
+        successful_election = yea_votes * 2 > len(self.players)
         self.round_history[-1].election_results = election_results
         self.round_history[-1].successful_election = successful_election
+        if successful_election:
+            self.round_history[-1].anarchy_counter = 0
+        else:
+            self.round_history[-1].anarchy_counter += 1
         return successful_election
 
     def hold_legislation_session(
@@ -274,43 +393,29 @@ class Game:
         """
         # Draw policies
         legislative_session_policies = self.draw_legislative_session_policies()
-        num_fascist_policies_for_president = legislative_session_policies.count(
-            Policy.FASCIST
-        )
+        # Liberal policies are 0 and Fascist policies are 1, so the sum counts Fascist policies
+        num_fascist_policies_for_president = sum(legislative_session_policies)
         self.round_history[-1].num_fascist_policies_for_president = (
             num_fascist_policies_for_president
         )
         # The president selects a policy to discard
-        match num_fascist_policies_for_president:
-            case 0:
-                policy_discarded_by_president = Policy.LIBERAL
-            case 1 | 2:
-                president_perceptive = self.get_player_percieved_game_state(president)
-                try:
-                    policy_discarded_by_president = (
-                        president.select_policy_to_discard_as_president(
-                            president_perceptive
-                        )
-                    )
-                    if policy_discarded_by_president not in [
-                        Policy.LIBERAL,
-                        Policy.FASCIST,
-                    ]:
-                        raise ValueError(
-                            f"Unknown policy type returned by player {president}: {policy_discarded_by_president}"
-                        )
-                except Exception as e:
-                    raise PlayerException(
-                        {
-                            "message": f"Exception from {president} while selecting policies as President",
-                            "player": president,
-                        }
-                    ) from e
-            case 3:
-                policy_discarded_by_president = Policy.FASCIST
-            case _:
-                raise ValueError(
-                    f"Invalid number of fascist policies ({num_fascist_policies_for_president}) handed to President."
+        if num_fascist_policies_for_president in _FORCED_PRESIDENT_DISCARD:
+            policy_discarded_by_president = _FORCED_PRESIDENT_DISCARD[
+                num_fascist_policies_for_president
+            ]
+        else:
+            policy_discarded_by_president = self._call_player(
+                president,
+                "select_policy_to_discard_as_president",
+                self.get_player_percieved_game_state(president),
+                context="selecting policies as President",
+            )
+            if not isinstance(policy_discarded_by_president, Policy):
+                raise PlayerException(
+                    {
+                        "message": f"Unknown policy type returned by player {president}: {policy_discarded_by_president}",
+                        "player": president,
+                    }
                 )
         num_fascist_policies_for_chancellor = (
             num_fascist_policies_for_president
@@ -324,160 +429,119 @@ class Game:
             num_fascist_policies_for_chancellor
         )
         # The chancellor selects a policy
-        match num_fascist_policies_for_chancellor:
-            case 0:
-                policy_discarded_by_chancellor = Policy.LIBERAL
-                selected_policy = Policy.LIBERAL
-            case 1:
-                chancellor_perceptive = self.get_player_percieved_game_state(chancellor)
-                try:
-                    policy_discarded_by_chancellor = (
-                        chancellor.select_policy_to_discard_as_chancellor(
-                            chancellor_perceptive
-                        )
-                    )
-                    if policy_discarded_by_chancellor not in [
-                        Policy.LIBERAL,
-                        Policy.FASCIST,
-                    ]:
-                        raise PlayerException(
-                            {
-                                "message": f"Invalid policy passed by chancellor ({chancellor}): {policy_discarded_by_chancellor}",
-                                "player": chancellor,
-                            }
-                        )
-                except Exception as e:
-                    raise PlayerException(
-                        {
-                            "message": f"Exception from {chancellor} while selecting policies as Chancellor.",
-                            "player": chancellor,
-                        }
-                    ) from e
-                selected_policy = (
-                    Policy.LIBERAL
-                    if policy_discarded_by_chancellor is Policy.FASCIST
-                    else Policy.FASCIST
+        if num_fascist_policies_for_chancellor in _FORCED_CHANCELLOR_DISCARD:
+            (
+                policy_discarded_by_chancellor,
+                selected_policy,
+            ) = _FORCED_CHANCELLOR_DISCARD[num_fascist_policies_for_chancellor]
+        else:
+            policy_discarded_by_chancellor = self._call_player(
+                chancellor,
+                "select_policy_to_discard_as_chancellor",
+                self.get_player_percieved_game_state(chancellor),
+                context="selecting policies as Chancellor",
+            )
+            if not isinstance(policy_discarded_by_chancellor, Policy):
+                raise PlayerException(
+                    {
+                        "message": f"Invalid policy passed by chancellor ({chancellor}): {policy_discarded_by_chancellor}",
+                        "player": chancellor,
+                    }
                 )
-            case 2:
-                policy_discarded_by_chancellor = Policy.FASCIST
-                selected_policy = Policy.FASCIST
+            selected_policy = (
+                Policy.LIBERAL
+                if policy_discarded_by_chancellor is Policy.FASCIST
+                else Policy.FASCIST
+            )
         self.round_history[-1].policy_discarded_by_chancellor = (
             policy_discarded_by_chancellor
         )
         # Veto
+        veto = False
         if self.fascist_policies_passed >= 5:
-            chancellor_perceptive = self.get_player_percieved_game_state(chancellor)
-            try:
-                chancellor_veto = chancellor.veto_legislation(chancellor_perceptive)
-                if not isinstance(chancellor_veto, bool):
-                    raise PlayerException(
-                        {
-                            "message": f"Invalid veto value by chancellor ({chancellor}): {policy_discarded_by_chancellor}",
-                            "player": chancellor,
-                        }
-                    )
-            except Exception as e:
+            chancellor_veto = self._call_player(
+                chancellor,
+                "veto_legislation",
+                self.get_player_percieved_game_state(chancellor),
+                context="vetoing legislation",
+            )
+            if not isinstance(chancellor_veto, bool):
                 raise PlayerException(
                     {
-                        "message": f"Exception from {chancellor} while vetoing legislation.",
+                        "message": f"Invalid veto value by chancellor ({chancellor}): {chancellor_veto}",
                         "player": chancellor,
                     }
-                ) from e
+                )
             self.round_history[-1].chancellor_veto = chancellor_veto
             if chancellor_veto:
-                president_perceptive = self.get_player_percieved_game_state(president)
-                try:
-                    president_veto = president.veto_legislation(president_perceptive)
-                    if not isinstance(president_veto, bool):
-                        raise PlayerException(
-                            {
-                                "message": f"Invalid veto value by president ({president}): {policy_discarded_by_president}",
-                                "player": president,
-                            }
-                        )
-                except Exception as e:
+                president_veto = self._call_player(
+                    president,
+                    "veto_legislation",
+                    self.get_player_percieved_game_state(president),
+                    context="vetoing legislation",
+                )
+                if not isinstance(president_veto, bool):
                     raise PlayerException(
                         {
-                            "message": f"Exception from {president} while vetoing legislation.",
+                            "message": f"Invalid veto value by president ({president}): {president_veto}",
                             "player": president,
                         }
-                    ) from e
+                    )
                 self.round_history[-1].president_veto = president_veto
                 veto = president_veto
-            else:
-                veto = False
-        else:
-            veto = False
 
         # Enact the policy
         if not veto:
-            match selected_policy:
-                case Policy.LIBERAL:
-                    self.liberal_policies_passed += 1
-                case Policy.FASCIST:
-                    self.fascist_policies_passed += 1
-                case _:
-                    raise ValueError(f"Unknown policy type {selected_policy}")
+            if selected_policy is Policy.LIBERAL:
+                self.liberal_policies_passed += 1
+                self.round_history[-1].number_of_liberal_policies_passed += 1
+            else:
+                self.fascist_policies_passed += 1
+                self.round_history[-1].number_of_fascist_policies_passed += 1
             self.round_history[-1].selected_policy = selected_policy
         # Claim policies
         # Neither president or chancellor get to know what the other claims before they claim
         president_perceptive = self.get_player_percieved_game_state(president)
         chancellor_perceptive = self.get_player_percieved_game_state(chancellor)
-        try:
-            (
-                president_claimed_number_of_fascist_cards_drawn,
-                president_claimed_discarded_policy,
-            ) = president.claimed_policy_to_discard_as_president(president_perceptive)
-            if president_claimed_number_of_fascist_cards_drawn not in [0, 1, 2, 3]:
-                raise PlayerException(
-                    {
-                        "message": f"Player {president} claimed an invalid number of fascist cards: "
-                        f"{president_claimed_number_of_fascist_cards_drawn}",
-                        "player": president,
-                    }
-                )
-            if president_claimed_discarded_policy not in [
-                Policy.LIBERAL,
-                Policy.FASCIST,
-            ]:
-                raise PlayerException(
-                    {
-                        "message": f"Player {president} claimed an invalid policy as President: "
-                        f"{president_claimed_discarded_policy}",
-                        "player": president,
-                    }
-                )
-        except Exception as e:
+        (
+            president_claimed_number_of_fascist_cards_drawn,
+            president_claimed_discarded_policy,
+        ) = self._call_player(
+            president,
+            "claimed_policy_to_discard_as_president",
+            president_perceptive,
+            context="claiming policies as President",
+        )
+        if president_claimed_number_of_fascist_cards_drawn not in [0, 1, 2, 3]:
             raise PlayerException(
                 {
-                    "message": f"Exception from {president} while claiming policies as President.",
+                    "message": f"Player {president} claimed an invalid number of fascist cards: "
+                    f"{president_claimed_number_of_fascist_cards_drawn}",
                     "player": president,
                 }
-            ) from e
-        try:
-            chancellor_claimed_discarded_policy = (
-                chancellor.claimed_policy_to_discard_as_chancellor(
-                    chancellor_perceptive
-                )
             )
-            if chancellor_claimed_discarded_policy not in [
-                Policy.LIBERAL,
-                Policy.FASCIST,
-            ]:
-                raise PlayerException(
-                    {
-                        "message": f"Player {chancellor} claimed an invalid policy as Chancellor: "
-                        f"{chancellor_claimed_discarded_policy}",
-                        "player": chancellor,
-                    }
-                )
-        except Exception as e:
+        if not isinstance(president_claimed_discarded_policy, Policy):
             raise PlayerException(
                 {
-                    "message": f"Exception from {chancellor} while claiming policies as Chancellor.",
+                    "message": f"Player {president} claimed an invalid policy as President: "
+                    f"{president_claimed_discarded_policy}",
+                    "player": president,
+                }
+            )
+        chancellor_claimed_discarded_policy = self._call_player(
+            chancellor,
+            "claimed_policy_to_discard_as_chancellor",
+            chancellor_perceptive,
+            context="claiming policies as Chancellor",
+        )
+        if not isinstance(chancellor_claimed_discarded_policy, Policy):
+            raise PlayerException(
+                {
+                    "message": f"Player {chancellor} claimed an invalid policy as Chancellor: "
+                    f"{chancellor_claimed_discarded_policy}",
                     "player": chancellor,
                 }
-            ) from e
+            )
         self.round_history[-1].president_claimed_number_of_fascist_cards_drawn = (
             president_claimed_number_of_fascist_cards_drawn
         )
@@ -491,46 +555,30 @@ class Game:
 
     def executive_action(self, president: Player):
         """Perform executive actions"""
-        match self.fascist_policies_passed:
-            # Investigate
-            case 1 | 2:
-                self.investigate_player(president)
-            # Special election
-            case 3:
-                self.declare_special_election(president)
-            # Bullet
-            case 4 | 5:
-                self.execute_player(president)
-            # Game Over
-            case 6:
-                pass
-            case _:
-                raise ValueError(
-                    f"Unknown number of Fascist policies passed: {self.fascist_policies_passed}"
-                )
+        if not 1 <= self.fascist_policies_passed <= 6:
+            raise ValueError(
+                f"Unknown number of Fascist policies passed: {self.fascist_policies_passed}"
+            )
+        executive_action = self._EXECUTIVE_ACTIONS[self.fascist_policies_passed]
+        if executive_action is not None:
+            executive_action(self, president)
 
     def investigate_player(self, president: Player):
         """The president investigates a player"""
         president_perceptive = self.get_player_percieved_game_state(president)
-        try:
-            investigated_player_id = president.select_player_to_investigate(
-                president_perceptive
-            )
-            if (
-                not isinstance(investigated_player_id, int)
-                or investigated_player_id < 0
-                or investigated_player_id > len(self.players) - 1
-            ):
-                raise ValueError(
-                    f"Invalid player_id {investigated_player_id} returned by President for investigating."
-                )
-        except Exception as e:
+        investigated_player_id = self._call_player(
+            president,
+            "select_player_to_investigate",
+            president_perceptive,
+            context="investigating as President",
+        )
+        if not self._is_player_id(investigated_player_id):
             raise PlayerException(
                 {
-                    "message": f"Exception from {president} while investigating as President.",
+                    "message": f"Invalid player_id {investigated_player_id} returned by President for investigating.",
                     "player": president,
                 }
-            ) from e
+            )
         investigated_player = self.players[investigated_player_id]
         if investigated_player in self.liberals:
             investigated_player_identity = Allegiance.LIBERAL
@@ -544,11 +592,20 @@ class Game:
         self.round_history[-1].investigated_player_identity = (
             investigated_player_identity
         )
-        claimed_investigated_player_allegiance = (
-            president.claimed_player_investigation_result(
-                president_perceptive,
-            )
+        # The President's claim is made knowing the investigation result
+        claimed_investigated_player_allegiance = self._call_player(
+            president,
+            "claimed_player_investigation_result",
+            self.get_player_percieved_game_state(president),
+            context="claiming investigation result as President",
         )
+        if not isinstance(claimed_investigated_player_allegiance, Allegiance):
+            raise PlayerException(
+                {
+                    "message": f"Invalid allegiance {claimed_investigated_player_allegiance} claimed by President for investigation.",
+                    "player": president,
+                }
+            )
         self.round_history[-1].claimed_investigated_player_allegiance = (
             claimed_investigated_player_allegiance
         )
@@ -557,27 +614,20 @@ class Game:
         """The president declares a special election"""
         # Feature option: Query every player for every President-Chancellor election option.
         # This would be computationally expensive but more realistic.
-        president_perceptive = self.get_player_percieved_game_state(president)
-        try:
-            special_election_president_id = president.select_special_election_president(
-                president_perceptive
-            )
-            if (
-                not isinstance(special_election_president_id, int)
-                or special_election_president_id < 0
-                or special_election_president_id > len(self.players) - 1
-            ):
-                raise ValueError(
-                    f"Invalid player_id {special_election_president_id} returned by President for selecting special "
-                    "president."
-                )
-        except Exception as e:
+        special_election_president_id = self._call_player(
+            president,
+            "select_special_election_president",
+            self.get_player_percieved_game_state(president),
+            context="calling special election as President",
+        )
+        if not self._is_player_id(special_election_president_id):
             raise PlayerException(
                 {
-                    "message": f"Exception from {president} while calling special election as President.",
+                    "message": f"Invalid player_id {special_election_president_id} returned by President for selecting "
+                    "special president.",
                     "player": president,
                 }
-            ) from e
+            )
         special_election_president = self.players[special_election_president_id]
         if special_election_president is president:
             raise PlayerException(
@@ -600,26 +650,19 @@ class Game:
 
     def execute_player(self, president: Player):
         """The president shoots a player"""
-        president_perceptive = self.get_player_percieved_game_state(president)
-        try:
-            executed_player_id = president.select_player_to_execute(
-                president_perceptive
-            )
-            if (
-                not isinstance(executed_player_id, int)
-                or executed_player_id < 0
-                or executed_player_id > len(self.players) - 1
-            ):
-                raise ValueError(
-                    f"Invalid player_id {executed_player_id} returned by President for execution."
-                )
-        except Exception as e:
+        executed_player_id = self._call_player(
+            president,
+            "select_player_to_execute",
+            self.get_player_percieved_game_state(president),
+            context="executing as President",
+        )
+        if not self._is_player_id(executed_player_id):
             raise PlayerException(
                 {
-                    "message": f"Exception from {president} while executing as President.",
+                    "message": f"Invalid player_id {executed_player_id} returned by President for execution.",
                     "player": president,
                 }
-            ) from e
+            )
         executed_player = self.players[executed_player_id]
         if executed_player in self.executed_players:
             raise PlayerException(
@@ -628,51 +671,94 @@ class Game:
                     "player": president,
                 }
             )
-        self.executed_players = self.executed_players + (executed_player,)
-        self.presidential_order = tuple(
-            player
-            for player in self.presidential_order
-            if player is not executed_player
-        )
+        self.executed_players.add(executed_player)
+        self.presidential_order.remove(executed_player)
         self.round_history[-1].executed_player = executed_player_id
+        # The previous tuple is shared by earlier rounds, so build a new one rather than changing it
+        self.round_history[-1].executed_players += (executed_player_id,)
+        self.round_history[-1].executed_mask |= 1 << executed_player_id
+        self.round_history[-1].living_mask &= ~(1 << executed_player_id)
+        self.round_history[-1].living_players = tuple(
+            player_id
+            for player_id in self.round_history[-1].living_players
+            if player_id != executed_player_id
+        )
+        self.update_ineligible_for_chancellorship(self.round_history[-1])
+
+    # Executive action granted to the President, indexed by the number of Fascist policies passed
+    _EXECUTIVE_ACTIONS = (
+        None,
+        # Investigate
+        investigate_player,
+        investigate_player,
+        # Special election
+        declare_special_election,
+        # Bullet
+        execute_player,
+        execute_player,
+        # Game Over
+        None,
+    )
+
+    @staticmethod
+    def _call_player(player: Player, method_name: str, *args, context: str):
+        """Call a player's method, blaming the player for any exception it raises
+
+        Args:
+            player (Player): The player being asked to act
+            method_name (str): The name of the player's method to call
+            context (str): What the player was doing, for the exception message
+
+        Returns:
+            The value returned by the player's method
+        """
+        try:
+            return getattr(player, method_name)(*args)
+        except Exception as e:
+            raise PlayerException(
+                {
+                    "message": f"Exception from {player} while {context}.",
+                    "player": player,
+                }
+            ) from e
+
+    def _is_player_id(self, player_id: int) -> bool:
+        """Return whether a value returned by a player is the id of a player in the game"""
+        return isinstance(player_id, int) and 0 <= player_id < len(self.players)
 
     def execute_anarchy(self):
         """Draws a random policy card following 3 failed elections"""
         next_policy = self.draw_anarchy_policy()
-        match next_policy:
-            case Policy.LIBERAL:
-                self.liberal_policies_passed += 1
-                self.round_history[-1].anarchy_result = Policy.LIBERAL
-            case Policy.FASCIST:
-                self.fascist_policies_passed += 1
-                self.round_history[-1].anarchy_result = Policy.FASCIST
+        if next_policy is Policy.LIBERAL:
+            self.liberal_policies_passed += 1
+            self.round_history[-1].number_of_liberal_policies_passed += 1
+        else:
+            self.fascist_policies_passed += 1
+            self.round_history[-1].number_of_fascist_policies_passed += 1
+        self.round_history[-1].anarchy_result = next_policy
 
-    def draw_legislative_session_policies(self) -> tuple[Policy]:
+    def draw_legislative_session_policies(self) -> bytearray:
         """Draws the top three cards of the policy deck for the legislative session
 
         Returns:
-            tuple[Policy]: Top three cards of the policy deck
+            bytearray: Top three cards of the policy deck, as Policy values
         """
-        legislative_session_policies = tuple(self.policy_deck[:3])
-        self.policy_deck = self.policy_deck[3:]
+        legislative_session_policies = self.policy_deck[:3]
+        del self.policy_deck[:3]
         return legislative_session_policies
 
     def draw_anarchy_policy(self) -> Policy:
         """Draws the top card of the policy deck for anarchy"""
-        anarchy_card = self.policy_deck[0]
-        self.policy_deck = self.policy_deck[1:]
-        return anarchy_card
+        return Policy(self.policy_deck.pop(0))
 
     def update_policy_deck(self):
         """Shuffles the deck if less than 3 policies remaining"""
         if len(self.policy_deck) < 3:
-            policy_deck_list = (11 - self.fascist_policies_passed) * [
-                Policy.FASCIST
-            ] + (6 - self.liberal_policies_passed) * [Policy.LIBERAL]
-            random.setstate(self.random_number_generator)
-            random.shuffle(policy_deck_list)
-            self.policy_deck = tuple(policy_deck_list)
-            self.random_number_generator = random.getstate()
+            self.policy_deck = bytearray(
+                (11 - self.fascist_policies_passed) * (Policy.FASCIST,)
+                + (6 - self.liberal_policies_passed) * (Policy.LIBERAL,)
+            )
+            self._rng.shuffle(self.policy_deck)
 
     def determine_if_winner(self) -> tuple[Optional[Allegiance], Optional[str]]:
         """Determine if there is a winner to the game
@@ -691,57 +777,113 @@ class Game:
         else:
             return None, None
 
-    def get_player_percieved_game_state(self, player: Player) -> tuple["RoundRecord"]:
+    def get_player_percieved_game_state(
+        self, player: Player
+    ) -> Sequence["RoundRecord"]:
         """Return a player's truth perspective of the current game state
 
+        Rounds are only copied when the player first reads them, so players that only look at the current round do not
+        pay for copying the rest of the game.
+
         Args:
             player (Player): The player to get the perspective of.
 
         Returns:
-            tuple[RoundRecord]: A fully copied representation of the truth game state for a given player
+            Sequence[RoundRecord]: A copied representation of the truth game state for a given player
         """
-        game_state = tuple()
-        for round in self.round_history:
-            # Deepcopy record
-            round_state = deepcopy(round)
-            # Update values
-            for field in fields(round_state):
-                value = getattr(round_state, field.name)
-                value = deepcopy(value)
-            # Set your round id
-            player_id = self.players.index(player)
-            round_state.your_player_id = player_id
-            # Add to tuple
-            game_state = game_state + (round_state,)
-        return game_state
-
-    def write_game_report(self):
-        report: tuple[str] = tuple()
+        player_id = self._player_id[player]
+        # Records of previous rounds no longer change, so copies of them are shared by every view of the player
+        closed_rounds = self._closed_game_states.setdefault(player_id, [])
+        return _PlayerView(self.round_history, player_id, closed_rounds)
+
+    @staticmethod
+    def _copy_round_record(round: "RoundRecord", player_id: int) -> "RoundRecord":
+        """Return a copy of a round record from a player's perspective
+
+        The copy shares no mutable state with the game's record, so a player can not change the game through it. The
+        vote dictionaries are handed out as read-only views, and the link to the previous round is dropped since players
+        read earlier rounds from the game state instead.
+
+        Args:
+            round (RoundRecord): The game's record of the round
+            player_id (int): The player id of the player the copy is for
+
+        Returns:
+            RoundRecord: Copy of the record, which only differs from the game's record by your player id
+        """
+        round_state = copy(round)
+        round_state.your_player_id = player_id
+        round_state._previous_record = None
+        # The game writes each vote dictionary once, fully built, so every copy can share the same read-only view
+        if round.declared_election_intent is not None:
+            if round._read_only_declared_election_intent is None:
+                round._read_only_declared_election_intent = MappingProxyType(
+                    {
+                        proposed_chancellor_id: MappingProxyType(intents)
+                        for proposed_chancellor_id, intents in round.declared_election_intent.items()
+                    }
+                )
+            round_state.declared_election_intent = (
+                round._read_only_declared_election_intent
+            )
+        if round.election_results is not None:
+            if round._read_only_election_results is None:
+                round._read_only_election_results = MappingProxyType(
+                    round.election_results
+                )
+            round_state.election_results = round._read_only_election_results
+        return round_state
+
+    def write_game_report(self) -> tuple[str]:
+        # Every round has the same fields, so only format their names once. Facts about the game come first.
+        field_names = _GAME_REPORT_FIELD_NAMES + tuple(
+            field.name for field in fields(RoundRecord) if field.repr
+        )
+        field_name_length = max(len(field_name) for field_name in field_names)
+        format_string = f"    {{field_name:{field_name_length}s}}: {{value}}"
+        report: list[str] = []
         for round_num, round_state in enumerate(self.round_history):
-            report += (f"Round #{round_num + 1}",)
-            field_name_length = max(len(field.name) for field in fields(round_state))
-            format_string = f"    {{field_name:{field_name_length}s}}: {{value}}"
-            for field in fields(round_state):
-                value = getattr(round_state, field.name)
+            report.append(f"Round #{round_num + 1}")
+            for field_name in field_names:
+                value = getattr(round_state, field_name)
                 if value is not None:
-                    report += (
-                        format_string.format(field_name=field.name, value=value),
+                    report.append(
+                        format_string.format(field_name=field_name, value=value)
                     )
-        return report
+        return tuple(report)
+
 
+@dataclass(slots=True, frozen=True)
+class GameRecord:
+    """Facts about a game that stay the same every round"""
+
+    number_of_players: int
+    fascists: frozenset[int]
+    hitler: int
+    # Bit i is set if player i is a fascist
+    fascist_mask: int
 
-@dataclass
+
+@dataclass(slots=True)
 class RoundRecord:
 
     ### CONSTANTS ###
 
-    number_of_players: int
-    fascists: tuple[int]
-    hitler: int
+    game_record: GameRecord = field(repr=False)
 
     ### PRIVATE ATTRIBUTES ###
 
-    _previous_record: Optional["RoundRecord"] = None
+    # Not part of the repr, so reporting a round does not format every round before it
+    _previous_record: Optional["RoundRecord"] = field(
+        default=None, repr=False, compare=False
+    )
+    # Read-only views of the vote dictionaries handed to players
+    _read_only_declared_election_intent: Optional[
+        Mapping[int, Mapping[int, Optional[bool]]]
+    ] = field(default=None, repr=False, compare=False)
+    _read_only_election_results: Optional[Mapping[int, bool]] = field(
+        default=None, repr=False, compare=False
+    )
 
     ### ACTION RESULTS ###
 
@@ -772,83 +914,108 @@ class RoundRecord:
 
     your_player_id: Optional[int] = None
 
+    ### RUNNING TOTALS ###
+
+    # Kept up to date by the game as the round is played
+    number_of_liberal_policies_passed: int = field(default=0, repr=False, compare=False)
+    number_of_fascist_policies_passed: int = field(default=0, repr=False, compare=False)
+    anarchy_counter: int = field(default=0, repr=False, compare=False)
+    # Ids of players who were executed
+    executed_players: tuple[int] = field(default=(), repr=False, compare=False)
+    # Ids of players ineligable for the chancellorship
+    ineligible_for_chancellorship: tuple[int] = field(
+        default=(), repr=False, compare=False
+    )
+    # Bitmasks of the above, where bit i is set for player i
+    executed_mask: int = field(default=0, repr=False, compare=False)
+    ineligible_mask: int = field(default=0, repr=False, compare=False)
+    # Ids of players who have not been executed, in order
+    living_players: tuple[int] = field(default=(), repr=False, compare=False)
+    # Bitmask of the above, where bit i is set for player i
+    living_mask: int = field(default=0, repr=False, compare=False)
+    # Ids of players eligable for the chancellorship, in order
+    eligible_for_chancellorship: tuple[int] = field(
+        default=(), repr=False, compare=False
+    )
+
+    def __copy__(self) -> "RoundRecord":
+        # Slotted dataclasses are copied through __getstate__, which is slower than passing every field to __init__
+        return RoundRecord(*_get_round_record_fields(self))
+
     ### HELPER FUNCTIONS ###
 
     @property
-    def number_of_liberal_policies_passed(self) -> int:
-        # This works both before and after selected policy is defined, but do no cache
-        passed_liberal_policy = (
-            self.selected_policy == Policy.LIBERAL
-            or self.anarchy_result == Policy.LIBERAL
-        )
-        if self._previous_record is not None:
-            return self._previous_record.number_of_liberal_policies_passed + int(
-                passed_liberal_policy
-            )
-        else:
-            return int(passed_liberal_policy)
+    def number_of_players(self) -> int:
+        return self.game_record.number_of_players
 
     @property
-    def number_of_fascist_policies_passed(self) -> int:
-        # This works both before and after selected policy is defined, but do no cache
-        passed_fascist_policy = (
-            self.selected_policy == Policy.FASCIST
-            or self.anarchy_result == Policy.FASCIST
-        )
-        if self._previous_record is not None:
-            return self._previous_record.number_of_fascist_policies_passed + int(
-                passed_fascist_policy
-            )
-        else:
-            return int(passed_fascist_policy)
+    def fascists(self) -> frozenset[int]:
+        return self.game_record.fascists
 
     @property
-    def anarchy_counter(self) -> int:
-        # Check where in the round we are
-        if self.election_results is None:
-            # Before elections
-            if self._previous_record is not None:
-                return self._previous_record.anarchy_counter
-            else:
-                return 0
-        else:
-            # After elections
-            if self.successful_election:
-                return 0
-            else:
-                if self._previous_record is not None:
-                    return self._previous_record.anarchy_counter + 1
-                else:
-                    return 1
+    def hitler(self) -> int:
+        return self.game_record.hitler
 
     @property
-    def executed_players(self) -> tuple[int]:
-        """Return a tuple of the ids of players who were executed"""
-        # Check where in the round we are
-        if self.executed_player is None:
-            # Before any executions
-            if self._previous_record is not None:
-                return self._previous_record.executed_players
-            else:
-                return tuple()
-        else:
-            # After any executions
-            if self._previous_record is not None:
-                return self._previous_record.executed_players + (self.executed_player,)
-            else:
-                return (self.executed_player,)
+    def fascist_mask(self) -> int:
+        """Return a bitmask of the ids of fascists, where bit i is set if player i is a fascist"""
+        return self.game_record.fascist_mask
 
-    @property
-    def ineligible_for_chancellorship(self) -> tuple[int]:
-        """Return a tuple of the ids of players ineligable for the chancellorship"""
-        if self._previous_record is None:
-            return tuple()
-        elif self.number_of_players - len(self.executed_players) <= 5:
-            return self._previous_record.executed_players
-        else:
-            if self._previous_record.successful_election:
-                return self._previous_record.executed_players + (
-                    self._previous_record.chancellor,
-                )
-            else:
-                return self._previous_record.ineligible_for_chancellorship
+
+_get_round_record_fields = attrgetter(*(field.name for field in fields(RoundRecord)))
+# Facts about the game reported for every round, read through the RoundRecord properties
+_GAME_REPORT_FIELD_NAMES = ("number_of_players", "fascists", "hitler")
+
+
+class _PlayerView(Sequence["RoundRecord"]):
+    """Read-only view of the game's round history from a player's perspective
+
+    The view is a snapshot of the game when it is created: the current round is copied up front, so anything the game
+    records afterwards needs a new view. Closed rounds no longer change, so they are copied the first time they are
+    read and the copies are shared by every view of the same player.
+    """
+
+    __slots__ = (
+        "_history",
+        "_length",
+        "_player_id",
+        "_closed_rounds",
+        "_current_round",
+    )
+
+    def __init__(
+        self,
+        history: list[RoundRecord],
+        player_id: int,
+        closed_rounds: list[Optional[RoundRecord]],
+    ):
+        self._history = history
+        self._length = len(history)
+        self._player_id = player_id
+        self._closed_rounds = closed_rounds
+        self._current_round: Optional[RoundRecord] = (
+            Game._copy_round_record(history[-1], player_id) if history else None
+        )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(self._length)))
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("round index out of range")
+        # The current round is still being played
+        if index == self._length - 1:
+            return self._current_round
+        # Closed rounds no longer change
+        closed_rounds = self._closed_rounds
+        if len(closed_rounds) <= index:
+            closed_rounds.extend((index + 1 - len(closed_rounds)) * (None,))
+        round = closed_rounds[index]
+        if round is None:
+            round = Game._copy_round_record(self._history[index], self._player_id)
+            closed_rounds[index] = round
+        return round
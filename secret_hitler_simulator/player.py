@@ -1,6 +1,6 @@
 # Standard Library Import
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Sequence
 
 # Module Imports
 from secret_hitler_simulator.constants import Allegiance, Policy
@@ -16,11 +16,11 @@ class Player(ABC):
 
     @classmethod
     @abstractmethod
-    def select_chancellor(cls, state: "tuple[RoundRecord]") -> int:
+    def select_chancellor(cls, state: "Sequence[RoundRecord]") -> int:
         """Returns selected Chancellor for proposed government as Chancellor
 
         Args:
-            state (tuple[RoundRecord]): Current state of the game from the player's perspective
+            state (Sequence[RoundRecord]): Current state of the game from the player's perspective
 
         Returns:
             int: The player id of the selected chancellor for the proposed government
@@ -30,28 +30,50 @@ class Player(ABC):
     @classmethod
     @abstractmethod
     def intent_to_vote_on_government(
-        cls, state: "tuple[RoundRecord]"
+        cls, state: "Sequence[RoundRecord]"
     ) -> Optional[bool]:
         """Return the publically declared intent to vote for the proposed government
 
         Args:
-            state (tuple[RoundRecord]): Current state of the game from the player's perspective
+            state (Sequence[RoundRecord]): Current state of the game from the player's perspective
 
         Returns:
             Optional[bool]: Ja (true), Nein (false), or no declaration of intent (None) for proposed government
         """
         raise NotImplementedError()
 
+    @classmethod
+    def intent_to_vote_on_governments(
+        cls, state: "Sequence[RoundRecord]", proposed_chancellor_ids: tuple[int]
+    ) -> dict[int, Optional[bool]]:
+        """Return the publically declared intent to vote for every proposed government
+
+        Override to decide on every proposed government at once. By default, asks intent_to_vote_on_government once
+        per proposed Chancellor.
+
+        Args:
+            state (Sequence[RoundRecord]): Current state of the game from the player's perspective
+            proposed_chancellor_ids (tuple[int]): The player ids of every Chancellor who could be proposed
+
+        Returns:
+            dict[int, Optional[bool]]: Ja (true), Nein (false), or no declaration of intent (None) for every proposed
+                Chancellor
+        """
+        return {
+            proposed_chancellor_id: cls.intent_to_vote_on_government(state)
+            for proposed_chancellor_id in proposed_chancellor_ids
+        }
+
     @classmethod
     @abstractmethod
     def vote_on_government(
         cls,
-        state: "tuple[RoundRecord]",
+        state: "Sequence[RoundRecord]",
     ) -> bool:
         """Return the players vote for the proposed government
 
         Args:
-            state (tuple[RoundRecord]): Current state of thhe game
+            state (Sequence[RoundRecord]): Current state of thhe game
 
         Returns:
             bool: Ja (true) or Nein (false) for proposed government"""
@@ -62,12 +84,12 @@ class Player(ABC):
     @classmethod
     @abstractmethod
     def select_policy_to_discard_as_president(
-        cls, state: "tuple[RoundRecord]"
+        cls, state: "Sequence[RoundRecord]"
     ) -> Policy:
         """Return the policy discarded as President when given a choice
 
         Args:
-            state (tuple[RoundRecord]): Current state of the game from the player's perspective
+            state (Sequence[RoundRecord]): Current state of the game from the player's perspective
 
         Returns:
             Policy: The policy discarded as President"""
@@ -76,12 +98,12 @@ class Player(ABC):
     @classmethod
     @abstractmethod
     def select_policy_to_discard_as_chancellor(
-        cls, state: "tuple[RoundRecord]"
+        cls, state: "Sequence[RoundRecord]"
     ) -> Policy:
         """Return what policy discarded as Chancellor when given a choice
 
         Args:
-            state (tuple[RoundRecord]): Current state of the game from the player's perspective
+            state (Sequence[RoundRecord]): Current state of the game from the player's perspective
 
         Returns:
             Policy: Selected policy
@@ -90,11 +112,11 @@ class Player(ABC):
 
     @classmethod
     @abstractmethod
-    def veto_legislation(cls, state: "tuple[RoundRecord]") -> int:
+    def veto_legislation(cls, state: "Sequence[RoundRecord]") -> int:
         """Return whether to veto legislation if Chancellor or President following 5th Fascist policy
 
         Args:
-            state (tuple[RoundRecord]): Current state of the game from the player's perspective
+            state (Sequence[RoundRecord]): Current state of the game from the player's perspective
 
         Returns:
             int: The player id of the player selected to be shot
@@ -107,12 +129,12 @@ class Player(ABC):
     @abstractmethod
     def claimed_policy_to_discard_as_president(
         cls,
-        state: "tuple[RoundRecord]",
+        state: "Sequence[RoundRecord]",
     ) -> tuple[int, Policy]:
         """Return the set of policies publicly claimed as the President. THIS IS WHERE YOU LIE!
 
         Args:
-            state (tuple[RoundRecord]): Current state of the game from the player's perspective
+            state (Sequence[RoundRecord]): Current state of the game from the player's perspective
 
         Returns:
             int: The publicly claimed number of fascist policies drawn
@@ -123,12 +145,12 @@ class Player(ABC):
     @classmethod
     @abstractmethod
     def claimed_policy_to_discard_as_chancellor(
-        cls, state: "tuple[RoundRecord]"
+        cls, state: "Sequence[RoundRecord]"
     ) -> int:
         """Return the set of policies publicly claimed as the Chancellor. THIS IS WHERE YOU LIE!
 
         Args:
-            state (tuple[RoundRecord]): Current state of the game from the player's perspective
+            state (Sequence[RoundRecord]): Current state of the game from the player's perspective
 
         Returns:
             int: The publicly claimed number of fascist policies handed to the Chancellor
@@ -139,11 +161,11 @@ class Player(ABC):
 
     @classmethod
     @abstractmethod
-    def select_player_to_investigate(cls, state: "tuple[RoundRecord]") -> int:
+    def select_player_to_investigate(cls, state: "Sequence[RoundRecord]") -> int:
         """Return the id of the player selected to investigate if President following 1st or 2nd Fascist policy
 
         Args:
-            state (tuple[RoundRecord]): Current state of the game from the player's perspective
+            state (Sequence[RoundRecord]): Current state of the game from the player's perspective
 
         Returns:
             int: The id of the player selected for investigation
@@ -154,12 +176,12 @@ class Player(ABC):
     @abstractmethod
     def claimed_player_investigation_result(
         cls,
-        state: "tuple[RoundRecord]",
+        state: "Sequence[RoundRecord]",
     ) -> Allegiance:
         """Return the publicly claimed investigation results if President following 1st or 2nd Fascist policy
 
         Args:
-            state (tuple[RoundRecord]): Current state of the game from the player's perspective
+            state (Sequence[RoundRecord]): Current state of the game from the player's perspective
 
         Returns:
             Allegiance: The publicly claimed investigation results
@@ -168,11 +190,11 @@ class Player(ABC):
 
     @classmethod
     @abstractmethod
-    def select_special_election_president(cls, state: "tuple[RoundRecord]") -> int:
+    def select_special_election_president(cls, state: "Sequence[RoundRecord]") -> int:
         """Return the id of the player selected as the President of the special election if President following 3rd Fascist policy
 
         Args:
-            state (tuple[RoundRecord]): Current state of the game from the player's perspective
+            state (Sequence[RoundRecord]): Current state of the game from the player's perspective
 
         Returns:
             int: The id of the player selected as the President of the special election
@@ -181,11 +203,11 @@ class Player(ABC):
 
     @classmethod
     @abstractmethod
-    def select_player_to_execute(cls, state: "tuple[RoundRecord]") -> int:
+    def select_player_to_execute(cls, state: "Sequence[RoundRecord]") -> int:
         """Return the player selected to shoot if President following 4th or 5th Fascist policy
 
         Args:
-            state (tuple[RoundRecord]): Current state of the game from the player's perspective
+            state (Sequence[RoundRecord]): Current state of the game from the player's perspective
 
         Returns:
             int: The player id of the player selected to be shot
@@ -1,8 +1,9 @@
 # Standard Library Imports
 import random
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Sequence
 
 # Module Imports
+from secret_hitler_simulator.bitmask import choose_set_bit
 from secret_hitler_simulator.constants import Allegiance, Policy
 from secret_hitler_simulator.player import Player
 
@@ -16,31 +17,27 @@ class AggroFascist(Player):
     ### FORMING GOVERNMENT DECISIONS ###
 
     @classmethod
-    def select_chancellor(cls, state: "tuple[RoundRecord]") -> int:
+    def select_chancellor(cls, state: "Sequence[RoundRecord]") -> int:
         """Randomly selects fascist Chancellor if able, prefering hitler if after 3 fascist politices"""
-        if state[-1].number_of_fascist_policies_passed > 3:
-            if state[-1].hitler not in state[-1].ineligible_for_chancellorship:
-                return state[-1].hitler
-        number_of_players = state[-1].number_of_players
+        current_round = state[-1]
+        ineligible_mask = current_round.ineligible_mask
+        if current_round.number_of_fascist_policies_passed > 3:
+            if not ineligible_mask >> current_round.hitler & 1:
+                return current_round.hitler
         valid_fascist_players = tuple(
             player
-            for player in state[-1].fascists
-            if player not in state[-1].ineligible_for_chancellorship
+            for player in current_round.fascists
+            if not ineligible_mask >> player & 1
         )
         if len(valid_fascist_players) > 0:
             return random.choice(valid_fascist_players)
         else:
             # If unable to select Fascist, randomly select someone
-            valid_players = tuple(
-                player
-                for player in range(number_of_players)
-                if player not in state[-1].ineligible_for_chancellorship
-            )
-            return random.choice(valid_players)
+            return random.choice(current_round.eligible_for_chancellorship)
 
     @classmethod
     def intent_to_vote_on_government(
-        cls, state: "tuple[RoundRecord]"
+        cls, state: "Sequence[RoundRecord]"
     ) -> Optional[bool]:
         """Always says how they will vote"""
         return cls.vote_on_government(state)
@@ -48,32 +45,33 @@ class AggroFascist(Player):
     @classmethod
     def vote_on_government(
         cls,
-        state: "tuple[RoundRecord]",
+        state: "Sequence[RoundRecord]",
     ) -> bool:
         """Only votes if at least one is a Fascist"""
+        current_round = state[-1]
         return (
-            state[-1].president in state[-1].fascists
-            or state[-1].chancellor in state[-1].fascists
+            current_round.president in current_round.fascists
+            or current_round.chancellor in current_round.fascists
         )
 
     ### LEGISLATIVE SESSION ###
 
     @classmethod
     def select_policy_to_discard_as_president(
-        cls, state: "tuple[RoundRecord]"
+        cls, state: "Sequence[RoundRecord]"
     ) -> Policy:
         """Always discards Liberal policies"""
         return Policy.LIBERAL
 
     @classmethod
     def select_policy_to_discard_as_chancellor(
-        cls, state: "tuple[RoundRecord]"
+        cls, state: "Sequence[RoundRecord]"
     ) -> Policy:
         """Always discards Liberal policies"""
         return Policy.LIBERAL
 
     @classmethod
-    def veto_legislation(cls, state: "tuple[RoundRecord]") -> int:
+    def veto_legislation(cls, state: "Sequence[RoundRecord]") -> int:
         """Always veto Liberal policies"""
         return state[-1].selected_policy is Policy.LIBERAL
 
@@ -82,25 +80,25 @@ class AggroFascist(Player):
     @classmethod
     def claimed_policy_to_discard_as_president(
         cls,
-        state: "tuple[RoundRecord]",
+        state: "Sequence[RoundRecord]",
     ) -> tuple[int, Policy]:
+        current_round = state[-1]
         # If no veto
-        if state[-1].selected_policy is not None:
+        if current_round.selected_policy is not None:
             # If Chancellor is Liberal
-            if state[-1].chancellor not in state[-1].fascists:
+            if current_round.chancellor not in current_round.fascists:
                 # Always say you gave them a choice, regardless of if you did
                 # TODO: Be smarter about number of fascist cards drawn
                 return (2, Policy.FASCIST)
             # If Chancellor is Fascist
             else:
-                match state[-1].selected_policy:
-                    # If passed Liberal, pretend it was a choice
-                    case Policy.LIBERAL:
-                        # TODO: Be smarter about number of fascist cards drawn
-                        return (2, Policy.FASCIST)
-                    # If passed Fascist, pretned there was no option
-                    case Policy.FASCIST:
-                        return (3, Policy.FASCIST)
+                # If passed Liberal, pretend it was a choice
+                if current_round.selected_policy is Policy.LIBERAL:
+                    # TODO: Be smarter about number of fascist cards drawn
+                    return (2, Policy.FASCIST)
+                # If passed Fascist, pretned there was no option
+                else:
+                    return (3, Policy.FASCIST)
         # If veto
         else:
             # I don't want to think about this, just say it was impossible
@@ -108,19 +106,19 @@ class AggroFascist(Player):
 
     @classmethod
     def claimed_policy_to_discard_as_chancellor(
-        cls, state: "tuple[RoundRecord]"
+        cls, state: "Sequence[RoundRecord]"
     ) -> int:
+        current_round = state[-1]
         # If no veto
-        if state[-1].selected_policy is not None:
+        if current_round.selected_policy is not None:
             # If President is Liberal
-            if state[-1].president not in state[-1].fascists:
-                match state[-1].selected_policy:
-                    # If passed Liberal, tell the truth
-                    case Policy.LIBERAL:
-                        return state[-1].policy_discarded_by_chancellor
-                    # If passed Fascist, trigger 50/50
-                    case Policy.FASCIST:
-                        return Policy.FASCIST
+            if current_round.president not in current_round.fascists:
+                # If passed Liberal, tell the truth
+                if current_round.selected_policy is Policy.LIBERAL:
+                    return current_round.policy_discarded_by_chancellor
+                # If passed Fascist, trigger 50/50
+                else:
+                    return Policy.FASCIST
             # If President is Fascist
             else:
                 # If passed Liberal, hopefully the President also pretends it was a choice.
@@ -134,59 +132,51 @@ class AggroFascist(Player):
     ### EXECUTIVE ACTIONS ###
 
     @classmethod
-    def select_player_to_investigate(cls, state: "tuple[RoundRecord]") -> int:
+    def select_player_to_investigate(cls, state: "Sequence[RoundRecord]") -> int:
         """Randomly investigate someone"""
-        number_of_players = state[-1].number_of_players
-        valid_players = [
-            player
-            for player in range(number_of_players)
-            if player not in state[-1].executed_players
-            and player is not state[-1].your_player_id
-        ]
-        return random.choice(valid_players)
+        current_round = state[-1]
+        # Every living player other than yourself
+        valid_players = current_round.living_mask & ~(1 << current_round.your_player_id)
+        return choose_set_bit(valid_players)
 
     @classmethod
     def claimed_player_investigation_result(
         cls,
-        state: "tuple[RoundRecord]",
+        state: "Sequence[RoundRecord]",
     ) -> Allegiance:
         """Always lie"""
         return (
-            Policy.LIBERAL
-            if state[-1].investigated_player_identity is Policy.FASCIST
-            else Policy.FASCIST
+            Allegiance.LIBERAL
+            if state[-1].investigated_player_identity is Allegiance.FASCIST
+            else Allegiance.FASCIST
         )
 
     @classmethod
-    def select_special_election_president(cls, state: "tuple[RoundRecord]") -> int:
+    def select_special_election_president(cls, state: "Sequence[RoundRecord]") -> int:
         """Randomly selects fascist President if able, avoiding hitler"""
-        number_of_players = state[-1].number_of_players
+        current_round = state[-1]
         valid_fascist_players = tuple(
             player
-            for player in state[-1].fascists
-            if player is not state[-1].hitler and player is not state[-1].your_player_id
+            for player in current_round.fascists
+            if player is not current_round.hitler
+            and player is not current_round.your_player_id
         )
         if len(valid_fascist_players) > 0:
             return random.choice(valid_fascist_players)
         else:
             # If unable to select Fascist, randomly select someone
-            valid_players = tuple(
-                player
-                for player in range(number_of_players)
-                if player not in state[-1].ineligible_for_chancellorship
-                and player is not state[-1].hitler
-                and player is not state[-1].your_player_id
+            valid_players = (
+                ((1 << current_round.number_of_players) - 1)
+                & ~current_round.ineligible_mask
+                & ~(1 << current_round.hitler)
+                & ~(1 << current_round.your_player_id)
             )
-            return random.choice(valid_players)
+            return choose_set_bit(valid_players)
 
     @classmethod
-    def select_player_to_execute(cls, state: "tuple[RoundRecord]") -> int:
+    def select_player_to_execute(cls, state: "Sequence[RoundRecord]") -> int:
         """Randomly execute a Liberal"""
-        number_of_players = state[-1].number_of_players
-        valid_players = [
-            player
-            for player in range(number_of_players)
-            if player not in state[-1].executed_players
-            and player not in state[-1].fascists
-        ]
-        return random.choice(valid_players)
+        current_round = state[-1]
+        # Every living liberal
+        valid_players = current_round.living_mask & ~current_round.fascist_mask
+        return choose_set_bit(valid_players)
@@ -1,8 +1,9 @@
 # Standard Library Imports
 import random
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Sequence
 
 # Module Imports
+from secret_hitler_simulator.bitmask import choose_set_bit
 from secret_hitler_simulator.constants import Allegiance, Policy
 from secret_hitler_simulator.player import Player
 
@@ -16,19 +17,13 @@ class NaiveLiberal(Player):
     ### FORMING GOVERNMENT DECISIONS ###
 
     @classmethod
-    def select_chancellor(cls, state: "tuple[RoundRecord]") -> int:
+    def select_chancellor(cls, state: "Sequence[RoundRecord]") -> int:
         """Randomly selects Chancellor from valid options"""
-        number_of_players = state[-1].number_of_players
-        valid_players = tuple(
-            player
-            for player in range(number_of_players)
-            if player not in state[-1].ineligible_for_chancellorship
-        )
-        return random.choice(valid_players)
+        return random.choice(state[-1].eligible_for_chancellorship)
 
     @classmethod
     def intent_to_vote_on_government(
-        cls, state: "tuple[RoundRecord]"
+        cls, state: "Sequence[RoundRecord]"
     ) -> Optional[bool]:
         """Always says how they will vote"""
         return cls.vote_on_government(state)
@@ -36,7 +31,7 @@ class NaiveLiberal(Player):
     @classmethod
     def vote_on_government(
         cls,
-        state: "tuple[RoundRecord]",
+        state: "Sequence[RoundRecord]",
     ) -> bool:
         """Always votes yes"""
         return True
@@ -45,20 +40,20 @@ class NaiveLiberal(Player):
 
     @classmethod
     def select_policy_to_discard_as_president(
-        cls, state: "tuple[RoundRecord]"
+        cls, state: "Sequence[RoundRecord]"
     ) -> Policy:
         """Always discards Fascist policies"""
         return Policy.FASCIST
 
     @classmethod
     def select_policy_to_discard_as_chancellor(
-        cls, state: "tuple[RoundRecord]"
+        cls, state: "Sequence[RoundRecord]"
     ) -> Policy:
         """Always discards Fascist policies"""
         return Policy.FASCIST
 
     @classmethod
-    def veto_legislation(cls, state: "tuple[RoundRecord]") -> int:
+    def veto_legislation(cls, state: "Sequence[RoundRecord]") -> int:
         """Always veto Fascist policies"""
         return state[-1].selected_policy is Policy.FASCIST
 
@@ -67,17 +62,18 @@ class NaiveLiberal(Player):
     @classmethod
     def claimed_policy_to_discard_as_president(
         cls,
-        state: "tuple[RoundRecord]",
+        state: "Sequence[RoundRecord]",
     ) -> tuple[int, Policy]:
         """Always tell the truth"""
+        current_round = state[-1]
         return (
-            state[-1].num_fascist_policies_for_president,
-            state[-1].policy_discarded_by_president,
+            current_round.num_fascist_policies_for_president,
+            current_round.policy_discarded_by_president,
         )
 
     @classmethod
     def claimed_policy_to_discard_as_chancellor(
-        cls, state: "tuple[RoundRecord]"
+        cls, state: "Sequence[RoundRecord]"
     ) -> int:
         """Always tell the truth"""
         return state[-1].policy_discarded_by_chancellor
@@ -85,44 +81,30 @@ class NaiveLiberal(Player):
     ### EXECUTIVE ACTIONS ###
 
     @classmethod
-    def select_player_to_investigate(cls, state: "tuple[RoundRecord]") -> int:
+    def select_player_to_investigate(cls, state: "Sequence[RoundRecord]") -> int:
         """Randomly investigate someone"""
-        number_of_players = state[-1].number_of_players
-        valid_players = [
-            player
-            for player in range(number_of_players)
-            if player not in state[-1].executed_players
-            and player is not state[-1].your_player_id
-        ]
-        return random.choice(valid_players)
+        current_round = state[-1]
+        # Every living player other than yourself
+        valid_players = current_round.living_mask & ~(1 << current_round.your_player_id)
+        return choose_set_bit(valid_players)
 
     @classmethod
     def claimed_player_investigation_result(
         cls,
-        state: "tuple[RoundRecord]",
+        state: "Sequence[RoundRecord]",
     ) -> Allegiance:
         """Always tell the truth"""
         return state[-1].investigated_player_identity
 
     @classmethod
-    def select_special_election_president(cls, state: "tuple[RoundRecord]") -> int:
+    def select_special_election_president(cls, state: "Sequence[RoundRecord]") -> int:
         """Randomly select someone"""
-        number_of_players = state[-1].number_of_players
-        valid_players = [
-            player
-            for player in range(number_of_players)
-            if player not in state[-1].executed_players
-            and player is not state[-1].your_player_id
-        ]
-        return random.choice(valid_players)
+        current_round = state[-1]
+        # Every living player other than yourself
+        valid_players = current_round.living_mask & ~(1 << current_round.your_player_id)
+        return choose_set_bit(valid_players)
 
     @classmethod
-    def select_player_to_execute(cls, state: "tuple[RoundRecord]") -> int:
+    def select_player_to_execute(cls, state: "Sequence[RoundRecord]") -> int:
         """Randomly select someone"""
-        number_of_players = state[-1].number_of_players
-        valid_players = [
-            player
-            for player in range(number_of_players)
-            if player not in state[-1].executed_players
-        ]
-        return random.choice(valid_players)
+        return random.choice(state[-1].living_players)
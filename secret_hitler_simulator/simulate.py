@@ -0,0 +1,96 @@
+# Standard Library Imports
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Callable, Optional, Sequence
+
+# Module Imports
+from secret_hitler_simulator.constants import Allegiance
+from secret_hitler_simulator.game import Game
+
+
+def simulate_many(
+    game_factory: Callable[[random.Random], Game],
+    num_games: int,
+    num_workers: Optional[int] = None,
+    seeds: Optional[Sequence[Optional[int]]] = None,
+) -> tuple[tuple[Allegiance, str]]:
+    """Play many independent games of Secret Hitler across worker processes
+
+    The game factory is sent to the workers, so it must be picklable (e.g. a module-level function or a
+    functools.partial of one). It is called once per game to build a fresh game, and should draw any randomness it
+    needs, such as the presidential order or policy deck, from the random number generator it is given.
+
+    Args:
+        game_factory (Callable[[random.Random], Game]): Builds a new game from the game's random number generator
+        num_games (int): The number of games to play
+        num_workers (Optional[int]): The number of worker processes, the number of CPUs if None. Games are played in
+            this process if 1.
+        seeds (Optional[Sequence[Optional[int]]]): The random number seed of each game, unseeded games if None
+
+    Returns:
+        tuple[tuple[Allegiance, str]]: The winning team and reason for victory of each game, in order
+    """
+    if seeds is None:
+        seeds = num_games * (None,)
+    elif len(seeds) != num_games:
+        raise ValueError(
+            f"Number of seeds ({len(seeds)}) does not match number of games ({num_games})."
+        )
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+
+    # Play games in this process, leaving the global random number generator as the caller had it
+    if num_workers == 1:
+        global_rng_state = random.getstate()
+        try:
+            return tuple(map(_play_one_game, repeat(game_factory, num_games), seeds))
+        finally:
+            random.setstate(global_rng_state)
+
+    # Play games across worker processes
+    chunksize = max(1, num_games // (num_workers * 4))
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        return tuple(
+            executor.map(
+                _play_one_game,
+                repeat(game_factory, num_games),
+                seeds,
+                chunksize=chunksize,
+            )
+        )
+
+
+def _play_one_game(
+    game_factory: Callable[[random.Random], Game], seed: Optional[int]
+) -> tuple[Allegiance, str]:
+    """Build and play a single game
+
+    Args:
+        game_factory (Callable[[random.Random], Game]): Builds a new game from the game's random number generator
+        seed (Optional[int]): The random number seed of the game
+
+    Returns:
+        Allegiance: The winning team
+        str: The reason for victory
+    """
+    game = game_factory(new_game_rng(seed))
+    return game.play_game()
+
+
+def new_game_rng(seed: Optional[int]) -> random.Random:
+    """Create the random number generator a game is set up from
+
+    The global random number generator used by players is reseeded from it, so a seeded game plays out the same wherever
+    it is played.
+
+    Args:
+        seed (Optional[int]): The random number seed of the game
+
+    Returns:
+        random.Random: The game's random number generator
+    """
+    rng = random.Random(seed)
+    random.seed(rng.getrandbits(64))
+    return rng